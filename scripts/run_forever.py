@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Long-running worker for the data update.
+Runs update_data.main() on every interval boundary in one process, so
+imports and pooled keep-alive sessions stay warm between ticks instead of
+being rebuilt by a fresh cron process. Response cache TTLs are shorter
+than the default interval, so every tick fetches fresh data.
+
+Usage:
+    python scripts/run_forever.py              # every 10 minutes, forever
+    python scripts/run_forever.py --once       # single run (cron mode)
+    python scripts/run_forever.py --interval 300
+
+NO FALLBACK DATA - a failed tick writes nothing; in --once mode the error
+propagates and the process exits non-zero, as with update_data.py.
+"""
+
+import argparse
+import time
+import traceback
+
+from update_data import main
+
+# Matches the 10-minute cadence the rolling history lengths assume
+DEFAULT_INTERVAL = 600  # seconds
+
+
+def seconds_until_next_tick(interval):
+    """Seconds until the next wall-clock multiple of interval."""
+    return interval - (time.time() % interval)
+
+
+def run_forever(interval=DEFAULT_INTERVAL):
+    """
+    Run main() at each interval boundary until interrupted.
+    A failing tick is logged and retried at the next boundary.
+    """
+    while True:
+        try:
+            main()
+        except Exception:
+            traceback.print_exc()
+            print('Update failed; data.json left unchanged.')
+
+        time.sleep(seconds_until_next_tick(interval))
+
+
+def positive_int(value):
+    """argparse type for a strictly positive integer."""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f'must be a positive integer, got {value}')
+    return number
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Run the strike data update on a fixed interval.')
+    parser.add_argument('--once', action='store_true', help='run a single update and exit')
+    parser.add_argument('--interval', type=positive_int, default=DEFAULT_INTERVAL,
+                        help=f'seconds between updates (default: {DEFAULT_INTERVAL})')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    if args.once:
+        main()
+    else:
+        try:
+            run_forever(args.interval)
+        except KeyboardInterrupt:
+            print('Stopped.')
@@ -0,0 +1,161 @@
+"""
+Response cache for source modules.
+
+Upstream data refreshes slowly relative to how often it can be requested
+(OpenSky ~10s, GDELT 15-min buckets, Outscraper/Polymarket minutes), so
+repeated fetches within a short window are served from memory, or from
+disk across re-runs, instead of the network.
+"""
+
+import functools
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+
+from _fastjson import dumps, loads
+
+# On-disk layer (repo root, git-ignored)
+CACHE_DIR = Path(__file__).parent.parent.parent / '.cache'
+
+# Disk entries untouched for longer than this are removed by prune_disk()
+DISK_MAX_AGE = 24 * 60 * 60  # seconds
+
+
+class TTLCache:
+    """
+    Minimal keyed cache where every entry expires after its own TTL.
+    Stores {key: (expires_at, value)} using the monotonic clock.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the cached value, or None if missing/expired."""
+        entry = self._entries.get(key)
+
+        if entry is None or time.monotonic() > entry[0]:
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key, value, ttl):
+        """Cache value under key for ttl seconds."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def stats(self):
+        """Return hit/miss counters and current size."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries)
+        }
+
+
+_MEMORY = TTLCache()
+
+# Single-flight: one lock per key so concurrent callers with the same
+# arguments wait for a single upstream request
+_KEY_LOCKS = {}
+_KEY_LOCKS_GUARD = threading.Lock()
+
+
+def _make_key(func, args, kwargs):
+    """Stable cache key from function name and arguments."""
+    raw = repr((func.__module__, func.__qualname__, args, sorted(kwargs.items())))
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def read_disk(key, ttl):
+    """
+    Read a cached value from disk.
+    Returns (value, age_seconds), or (None, None) if missing/expired.
+    """
+    try:
+        entry = loads((CACHE_DIR / f'{key}.json').read_bytes())
+    except (OSError, ValueError):
+        return None, None
+
+    age = time.time() - entry.get('ts', 0)
+    if age > ttl:
+        return None, None
+
+    return entry.get('value'), age
+
+
+def write_disk(key, value):
+    """Write a value to disk atomically; cache failures are non-fatal."""
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        path = CACHE_DIR / f'{key}.json'
+        tmp = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        tmp.write_bytes(dumps({'ts': time.time(), 'value': value}))
+        os.replace(tmp, path)
+    except (OSError, TypeError):
+        pass
+
+
+def prune_disk(max_age=DISK_MAX_AGE):
+    """
+    Delete disk entries (and stray temp files) not written for max_age
+    seconds, so the cache directory stays bounded in a long-running
+    worker. Failures are non-fatal.
+    """
+    cutoff = time.time() - max_age
+    try:
+        paths = list(CACHE_DIR.iterdir())
+    except OSError:
+        return
+
+    for path in paths:
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+
+def memoize_ttl(ttl):
+    """
+    Cache a fetch function's JSON result for ttl seconds, keyed by its
+    arguments. Checks memory first, then disk, then calls upstream.
+    Exceptions (e.g. non-2xx via raise_for_status) are never cached.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(func, args, kwargs)
+
+            value = _MEMORY.get(key)
+            if value is not None:
+                return value
+
+            with _KEY_LOCKS_GUARD:
+                lock = _KEY_LOCKS.setdefault(key, threading.Lock())
+
+            with lock:
+                # Another thread may have filled the cache while we waited
+                value = _MEMORY.get(key)
+                if value is not None:
+                    return value
+
+                value, age = read_disk(key, ttl)
+                if value is None:
+                    value = func(*args, **kwargs)
+                    age = 0
+                    write_disk(key, value)
+
+                _MEMORY.set(key, value, ttl - age)
+
+            return value
+
+        return wrapper
+
+    return decorator
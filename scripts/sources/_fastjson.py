@@ -0,0 +1,26 @@
+"""
+JSON helpers for source modules.
+
+Uses orjson (C parser, accepts bytes directly) when it is installed and
+falls back to the stdlib json module otherwise.
+"""
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def loads(data):
+    """Parse JSON from bytes or str (e.g. response.content)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj):
+    """Serialize obj to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
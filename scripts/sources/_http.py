@@ -0,0 +1,90 @@
+"""
+Shared HTTP helpers for source modules.
+
+Each source keeps one module-level session so repeated calls to the same
+host reuse the pooled keep-alive connection instead of paying a fresh
+TCP + TLS handshake per request.
+"""
+
+import hashlib
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from _cache import DISK_MAX_AGE, read_disk, write_disk
+from _fastjson import loads
+
+
+def create_session(pool_connections=4, pool_maxsize=8, retries=2,
+                   backoff_factor=0.3, status_forcelist=(502, 503, 504)):
+    """
+    Create a requests.Session with a pooled, retrying HTTPS adapter.
+
+    Retries cover connection errors and the given status codes. Once
+    retries are exhausted the last response is returned as-is, so
+    callers still surface failures through raise_for_status().
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    # requests already sends keep-alive; set it explicitly for clarity
+    session.headers['Connection'] = 'keep-alive'
+
+    return session
+
+
+def create_opensky_session():
+    """
+    Create the session shared by the OpenSky source modules.
+
+    OpenSky answers 429 once the anonymous credit budget is spent, so
+    retrying it only burns more credits; only connection errors and 5xx
+    are retried. Each module makes one OpenSky request per run, so the
+    pool holds a single connection.
+    """
+    return create_session(pool_connections=1, pool_maxsize=1)
+
+
+def get_json(session, url, params=None, timeout=30):
+    """
+    GET a JSON resource, revalidating with the ETag/Last-Modified of the
+    previous response. On 304 Not Modified the stored body is returned,
+    skipping the download and decode. Servers that send no validators
+    are simply fetched in full every time. Stored validators expire
+    after DISK_MAX_AGE, like every other disk cache entry.
+    """
+    key = 'http-' + hashlib.sha1(repr((url, params)).encode()).hexdigest()
+    stored, _ = read_disk(key, DISK_MAX_AGE)
+
+    headers = {}
+    if stored:
+        if stored.get('etag'):
+            headers['If-None-Match'] = stored['etag']
+        if stored.get('last_modified'):
+            headers['If-Modified-Since'] = stored['last_modified']
+
+    response = session.get(url, params=params, headers=headers, timeout=timeout)
+    if response.status_code == 304 and stored:
+        return stored['body']
+    response.raise_for_status()
+
+    body = loads(response.content)
+
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        write_disk(key, {'etag': etag, 'last_modified': last_modified, 'body': body})
+
+    return body
@@ -17,11 +17,19 @@ Docs: https://openskynetwork.github.io/opensky-api/rest.html
 Uses anonymous access (no authentication required).
 """
 
-import requests
 from datetime import datetime, timezone
 
+from _cache import memoize_ttl
+from _http import create_opensky_session, get_json
+
 BASE_URL = 'https://opensky-network.org/api/states/all'
 
+# Shared keep-alive session
+_SESSION = create_opensky_session()
+
+# OpenSky anonymous data updates every ~10s; reuse responses briefly
+AIRCRAFT_CACHE_TTL = 30  # seconds
+
 # Iran bounding box (accurate)
 # Source: https://gist.github.com/graydon/11198540
 IRAN_BBOX = {
@@ -39,45 +47,78 @@ PERSIAN_GULF_BBOX = {
     'lomax': 58.0     # Oman/Strait of Hormuz
 }
 
+# The two regions overlap heavily, so fetch their union once and
+# partition aircraft locally (one request, fewer OpenSky credits)
+UNION_BBOX = {
+    'lamin': min(IRAN_BBOX['lamin'], PERSIAN_GULF_BBOX['lamin']),
+    'lamax': max(IRAN_BBOX['lamax'], PERSIAN_GULF_BBOX['lamax']),
+    'lomin': min(IRAN_BBOX['lomin'], PERSIAN_GULF_BBOX['lomin']),
+    'lomax': max(IRAN_BBOX['lomax'], PERSIAN_GULF_BBOX['lomax'])
+}
+
 # Minimum history needed for rolling baseline
 MIN_HISTORY_FOR_BASELINE = 6  # ~1 hour at 10-min intervals
 
 
+@memoize_ttl(AIRCRAFT_CACHE_TTL)
 def fetch_aircraft(bbox):
     """
     Fetch aircraft states within a bounding box.
     Uses anonymous access (no authentication).
+    Responses are cached for AIRCRAFT_CACHE_TTL seconds per bbox.
     """
-    params = {
-        'lamin': bbox['lamin'],
-        'lamax': bbox['lamax'],
-        'lomin': bbox['lomin'],
-        'lomax': bbox['lomax']
-    }
+    # Bbox dicts already use OpenSky's query parameter names
+    return get_json(_SESSION, BASE_URL, params=bbox)
 
-    response = requests.get(BASE_URL, params=params, timeout=30)
-    response.raise_for_status()
 
-    return response.json()
+def in_bbox(lat, lon, bbox):
+    """Check if a position lies within a bounding box (inclusive)."""
+    return (bbox['lamin'] <= lat <= bbox['lamax'] and
+            bbox['lomin'] <= lon <= bbox['lomax'])
 
 
-def count_airborne(data):
+def count_airborne_by_region(data):
     """
-    Count airborne aircraft from OpenSky response.
+    Count airborne aircraft per region from a UNION_BBOX response.
+    An aircraft in the overlap counts towards both regions, exactly as
+    when each region was fetched separately.
+
+    Returns: (iran_count, gulf_count)
     """
     states = data.get('states') or []
-    count = 0
+    iran_count = 0
+    gulf_count = 0
 
+    # OpenSky rows are fixed-width (17 fields):
+    # 5 = longitude, 6 = latitude, 8 = on_ground
     for state in states:
-        if len(state) >= 9:
-            on_ground = state[8]
-            if not on_ground:
-                count += 1
+        if state[8]:
+            continue
+
+        lon = state[5]
+        lat = state[6]
+        if lat is None or lon is None:
+            continue
 
-    return count
+        if in_bbox(lat, lon, IRAN_BBOX):
+            iran_count += 1
+        if in_bbox(lat, lon, PERSIAN_GULF_BBOX):
+            gulf_count += 1
 
+    return iran_count, gulf_count
 
-def calculate_risk_from_baseline(current_count, history):
+
+def get_baseline(history):
+    """
+    Rolling baseline (mean of history) computed once per run.
+    Returns None when there is not enough history yet.
+    """
+    if len(history) < MIN_HISTORY_FOR_BASELINE:
+        return None
+    return sum(history) / len(history)
+
+
+def calculate_risk_from_baseline(current_count, baseline):
     """
     Calculate risk based on deviation from rolling baseline.
 
@@ -92,9 +133,12 @@ def calculate_risk_from_baseline(current_count, history):
     - Alert (40-60% drop): 50-80 risk
     - Critical (>60% drop): 80-100 risk
 
+    Args:
+        baseline: Rolling average from get_baseline(), or None on cold start
+
     Returns: risk score 0-100
     """
-    if len(history) < MIN_HISTORY_FOR_BASELINE:
+    if baseline is None:
         # Cold start: use conservative linear estimate
         # We expect ~50-100 aircraft in combined region per snapshot
         # Lower than 30 is concerning, 0 is critical
@@ -107,9 +151,6 @@ def calculate_risk_from_baseline(current_count, history):
         else:
             return min(100, 80 + (10 - current_count) * 2)  # 80-100
 
-    # Calculate rolling baseline
-    baseline = sum(history) / len(history)
-
     if baseline <= 0:
         baseline = 1  # Avoid division by zero
 
@@ -148,24 +189,20 @@ def get_aviation_risk(history=None):
     if history is None:
         history = []
 
-    # Get aircraft counts
-    iran_data = fetch_aircraft(IRAN_BBOX)
-    iran_count = count_airborne(iran_data)
-
-    gulf_data = fetch_aircraft(PERSIAN_GULF_BBOX)
-    gulf_count = count_airborne(gulf_data)
+    # Get aircraft counts - single request covering both regions
+    data = fetch_aircraft(UNION_BBOX)
+    iran_count, gulf_count = count_airborne_by_region(data)
 
     total_count = iran_count + gulf_count
 
-    # Calculate risk from rolling baseline
-    risk = calculate_risk_from_baseline(total_count, history)
+    # Calculate risk from rolling baseline (single pass over history)
+    baseline_avg = get_baseline(history)
+    risk = calculate_risk_from_baseline(total_count, baseline_avg)
 
     # Calculate baseline stats for transparency
-    if len(history) >= MIN_HISTORY_FOR_BASELINE:
-        baseline_avg = sum(history) / len(history)
+    if baseline_avg is not None:
         deviation_pct = ((baseline_avg - total_count) / baseline_avg * 100) if baseline_avg > 0 else 0
     else:
-        baseline_avg = None
         deviation_pct = None
 
     return {
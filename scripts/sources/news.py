@@ -11,16 +11,40 @@ Rate limit: 1 request per 5 seconds (we only make 1 per 10-min run)
 Auth: None required (free)
 """
 
-import requests
 from datetime import datetime, timezone
+from operator import itemgetter
+from urllib.parse import urlencode
+
+from _cache import memoize_ttl
+from _http import create_session, get_json
 
 BASE_URL = 'https://api.gdeltproject.org/api/v2/doc/doc'
 
+# Shared keep-alive session
+# Use browser User-Agent to avoid rate limiting
+_SESSION = create_session(pool_connections=1, pool_maxsize=1)
+_SESSION.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# GDELT timelines use 15-min buckets. Kept below the 10-minute update
+# interval so a tick never reuses the previous tick's response
+GDELT_CACHE_TTL = 540  # seconds
+
 # Iran-related search query for geopolitical monitoring
 # Using OR to combine related terms - must be in parentheses per GDELT API
 SEARCH_QUERY = '("Iran military" OR "Iran strike" OR "Iran attack" OR "US Iran" OR "Israel Iran")'
 
+GDELT_PARAMS = {
+    'query': SEARCH_QUERY,
+    'mode': 'timelinevol',  # Returns % of global coverage
+    'format': 'json',
+    'timespan': '24h'  # Last 24 hours with 15-min resolution
+}
+
+# Query is constant, so encode the full URL once at import
+GDELT_URL = f'{BASE_URL}?{urlencode(GDELT_PARAMS)}'
+
 
+@memoize_ttl(GDELT_CACHE_TTL)
 def fetch_gdelt_coverage():
     """
     Fetch Iran news coverage from GDELT DOC 2.0 API.
@@ -29,23 +53,26 @@ def fetch_gdelt_coverage():
     The timelinevol mode returns coverage as a percentage of ALL global
     news monitored by GDELT - this is a built-in baseline that doesn't
     require arbitrary thresholds.
+
+    Responses are cached for GDELT_CACHE_TTL seconds.
     """
-    params = {
-        'query': SEARCH_QUERY,
-        'mode': 'timelinevol',  # Returns % of global coverage
-        'format': 'json',
-        'timespan': '24h'  # Last 24 hours with 15-min resolution
-    }
+    return get_json(_SESSION, GDELT_URL)
 
-    # Use browser User-Agent to avoid rate limiting
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    }
 
-    response = requests.get(BASE_URL, params=params, headers=headers, timeout=30)
-    response.raise_for_status()
+def parse_gdelt_date(date_str):
+    """
+    Parse GDELT date format YYYYMMDDTHHMMSSZ into an aware UTC datetime.
+    Slices fixed-width fields directly (much faster than strptime).
+    Raises ValueError/TypeError on malformed input, like strptime.
+    """
+    if len(date_str) != 16 or date_str[8] != 'T' or date_str[15] != 'Z':
+        raise ValueError(f'Invalid GDELT date: {date_str!r}')
 
-    return response.json()
+    return datetime(
+        int(date_str[0:4]), int(date_str[4:6]), int(date_str[6:8]),
+        int(date_str[9:11]), int(date_str[11:13]), int(date_str[13:15]),
+        tzinfo=timezone.utc
+    )
 
 
 def parse_timeline_data(data):
@@ -84,8 +111,7 @@ def parse_timeline_data(data):
 
         # Parse GDELT date format: YYYYMMDDTHHMMSSZ
         try:
-            dt = datetime.strptime(date_str, '%Y%m%dT%H%M%SZ')
-            dt = dt.replace(tzinfo=timezone.utc)
+            dt = parse_gdelt_date(date_str)
             parsed.append((dt, float(value)))
         except (ValueError, TypeError):
             continue
@@ -143,12 +169,11 @@ def get_news_risk():
             }
         }
 
-    # Get the most recent data point
-    timeline_entries.sort(key=lambda x: x[0], reverse=True)
-    latest_dt, latest_pct = timeline_entries[0]
+    # Get the most recent data point (single O(n) pass, no sort needed)
+    latest_dt, latest_pct = max(timeline_entries, key=itemgetter(0))
 
     # Calculate average over the period for context
-    avg_pct = sum(v for _, v in timeline_entries) / len(timeline_entries)
+    avg_pct = sum(map(itemgetter(1), timeline_entries)) / len(timeline_entries)
 
     # Calculate risk from latest coverage
     risk = calculate_risk(latest_pct)
@@ -11,11 +11,19 @@ Docs: https://app.outscraper.com/api-docs
 
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+from _cache import memoize_ttl
+from _http import create_session
+from _fastjson import loads
+
 OUTSCRAPER_API_KEY = os.environ.get('OUTSCRAPER_API_KEY')
 BASE_URL = 'https://api.app.outscraper.com/maps/search-v3'
 
+# Popular times move on a scale of minutes
+PLACE_CACHE_TTL = 300  # seconds
+
 # Pizza places near Pentagon to monitor (by place_id for reliable results)
 # These are pizza places in Pentagon City/Crystal City, Arlington VA
 PENTAGON_PIZZA_PLACES = [
@@ -26,40 +34,72 @@ PENTAGON_PIZZA_PLACES = [
     'ChIJ42QeLXu3t4kRnArvcaz2o3A',  # District Pizza Palace, 2325 S Eads St
 ]
 
+# Shared session: one pooled connection per concurrent place fetch, with
+# retry/backoff on connection errors, timeouts and 429/5xx
+_SESSION = create_session(
+    pool_connections=1, pool_maxsize=len(PENTAGON_PIZZA_PLACES), retries=3,
+    status_forcelist=(429, 502, 503, 504)
+)
+if OUTSCRAPER_API_KEY:
+    _SESSION.headers['X-API-KEY'] = OUTSCRAPER_API_KEY
+
 # Day indices (Monday = 0)
 DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
 
 
-def fetch_place_data(place_id, retries=3):
+@memoize_ttl(PLACE_CACHE_TTL)
+def fetch_place_data(place_id):
     """
     Fetch place data including popular times from Outscraper by place_id.
-    Retries on timeout/connection errors.
+    Retries on timeout/connection errors are handled by the session.
+    Responses are cached for PLACE_CACHE_TTL seconds per place.
     """
     if not OUTSCRAPER_API_KEY:
         raise ValueError('OUTSCRAPER_API_KEY environment variable not set')
 
-    headers = {
-        'X-API-KEY': OUTSCRAPER_API_KEY
-    }
-
     params = {
         'query': place_id,
         'limit': 1,
         'async': 'false'
     }
 
-    last_error = None
-    for attempt in range(retries):
-        try:
-            response = requests.get(BASE_URL, params=params, headers=headers, timeout=90)
-            response.raise_for_status()
-            # Outscraper returns {"data": [[{place}]]}
-            data = response.json()
-            return data['data'][0][0]
-        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
-            last_error = e
+    response = _SESSION.get(BASE_URL, params=params, timeout=90)
+    response.raise_for_status()
 
-    raise last_error
+    # Outscraper returns {"data": [[{place}]]}
+    data = loads(response.content)
+    return data['data'][0][0]
+
+
+def _safe_fetch(place_id):
+    """
+    Fetch a place so one slow or failing place doesn't sink the whole
+    batch. Failures are logged and returned alongside the result.
+
+    Returns: (place dict or None, exception or None)
+    """
+    try:
+        return fetch_place_data(place_id), None
+    except (requests.exceptions.RequestException, KeyError, IndexError) as e:
+        print(f'  Pentagon: fetch failed for place {place_id}: {e!r}')
+        return None, e
+
+
+def fetch_all_places(place_ids):
+    """
+    Fetch all places concurrently (each call can block for up to 90s).
+    Returns list of place dicts (or None for failures) in input order.
+    If every fetch fails, the first error is re-raised (e.g. a revoked
+    API key surfaces as the 401/403 itself).
+    """
+    with ThreadPoolExecutor(max_workers=len(place_ids)) as executor:
+        results = list(executor.map(_safe_fetch, place_ids))
+
+    errors = [error for _, error in results if error is not None]
+    if errors and len(errors) == len(results):
+        raise errors[0]
+
+    return [place for place, _ in results]
 
 
 def get_live_busyness(popular_times):
@@ -73,51 +113,77 @@ def get_live_busyness(popular_times):
     return None
 
 
-def get_historical_busyness(popular_times, day_index, hour):
+def build_week_table(popular_times):
     """
-    Get historical busyness for specific day/hour.
+    Index historical popular_times once as {api_day: {hour: percentage}}
+    so per-day/hour lookups don't rescan the nested lists.
     API structure: {'day': 1-7, 'popular_times': [{'hour': N, 'percentage': X}, ...]}
+    """
+    week = {}
+    for entry in popular_times:
+        day = entry.get('day')
+        if day == 'live':
+            continue
+        hours = week.setdefault(day, {})
+        for hour_data in entry['popular_times']:
+            hours.setdefault(hour_data['hour'], hour_data['percentage'])
+    return week
+
+
+def get_historical_busyness(week, day_index, hour):
+    """
+    Get historical busyness for specific day/hour from build_week_table().
     Python weekday: 0=Mon...6=Sun -> API day: 1=Mon...7=Sun
     """
     api_day = day_index + 1  # Convert Python weekday to API day
-
-    for entry in popular_times:
-        if entry.get('day') == api_day:
-            for hour_data in entry['popular_times']:
-                if hour_data['hour'] == hour:
-                    return hour_data['percentage']
-    return None
+    return week.get(api_day, {}).get(hour)
 
 
-def get_baseline_busyness(popular_times, hour):
+def get_baseline_busyness(week, hour):
     """
     Get average busyness for this hour across all days (baseline).
     If hour doesn't exist (e.g., late night when closed), use overall average.
     """
-    hour_total = 0
-    hour_count = 0
-    all_total = 0
-    all_count = 0
-
-    for entry in popular_times:
-        if entry.get('day') == 'live':
-            continue
-        for hour_data in entry['popular_times']:
-            if hour_data['percentage'] > 0:
-                all_total += hour_data['percentage']
-                all_count += 1
-                if hour_data['hour'] == hour:
-                    hour_total += hour_data['percentage']
-                    hour_count += 1
+    hour_values = [hours[hour] for hours in week.values() if hours.get(hour, 0) > 0]
 
     # Prefer specific hour average, fallback to overall average
-    if hour_count > 0:
-        return hour_total / hour_count
-    elif all_count > 0:
-        return all_total / all_count
+    if hour_values:
+        return sum(hour_values) / len(hour_values)
+
+    all_values = [pct for hours in week.values() for pct in hours.values() if pct > 0]
+    if all_values:
+        return sum(all_values) / len(all_values)
     return None
 
 
+def score_place(current_busyness, baseline, is_late_night):
+    """
+    Score one place's busyness against its baseline.
+    Pure function so it can be reused for batch/backfill scoring.
+
+    Returns: (score 0-100, status)
+    """
+    # Compare current to baseline
+    ratio = current_busyness / baseline
+
+    # Score: normal = ~50, elevated = 60-80, high = 80+
+    if ratio <= 1.0:
+        score = int(50 * ratio)
+        status = 'normal'
+    elif ratio <= 1.5:
+        score = int(50 + (ratio - 1.0) * 60)
+        status = 'elevated'
+    else:
+        score = min(100, int(80 + (ratio - 1.5) * 40))
+        status = 'high'
+
+    # Late night bonus - unusual activity is more significant
+    if is_late_night and current_busyness > 20:
+        score = min(100, score + 15)
+
+    return score, status
+
+
 def get_pentagon_pizza_risk():
     """
     Monitor pizza place activity near Pentagon and calculate risk score.
@@ -135,8 +201,11 @@ def get_pentagon_pizza_risk():
     total_score = 0
     valid_places = 0
 
-    for place_id in PENTAGON_PIZZA_PLACES:
-        place = fetch_place_data(place_id)
+    places = fetch_all_places(PENTAGON_PIZZA_PLACES)
+
+    for place in places:
+        if place is None:
+            continue
 
         name = place['name']
         popular_times = place.get('popular_times')
@@ -145,31 +214,16 @@ def get_pentagon_pizza_risk():
             continue
 
         # Try live data first, fall back to historical
+        week = build_week_table(popular_times)
         current_busyness = get_live_busyness(popular_times)
         if current_busyness is None:
-            current_busyness = get_historical_busyness(popular_times, day_index, hour)
-        baseline = get_baseline_busyness(popular_times, hour)
+            current_busyness = get_historical_busyness(week, day_index, hour)
+        baseline = get_baseline_busyness(week, hour)
 
         if current_busyness is None or baseline is None:
             continue
 
-        # Compare current to baseline
-        ratio = current_busyness / baseline
-
-        # Score: normal = ~50, elevated = 60-80, high = 80+
-        if ratio <= 1.0:
-            score = int(50 * ratio)
-            status = 'normal'
-        elif ratio <= 1.5:
-            score = int(50 + (ratio - 1.0) * 60)
-            status = 'elevated'
-        else:
-            score = min(100, int(80 + (ratio - 1.5) * 40))
-            status = 'high'
-
-        # Late night bonus - unusual activity is more significant
-        if is_late_night and current_busyness > 20:
-            score = min(100, score + 15)
+        score, status = score_place(current_busyness, baseline, is_late_night)
 
         valid_places += 1
         total_score += score
@@ -12,12 +12,24 @@ Query params for /events:
 - closed: boolean to filter by closed status
 """
 
-import json
-import requests
 from datetime import datetime, timezone
 
+from _cache import memoize_ttl
+from _http import create_session, get_json
+from _fastjson import loads
+
 BASE_URL = 'https://gamma-api.polymarket.com'
 
+# Shared keep-alive session with retry/backoff on 429/5xx
+# (one request per run, so a single pooled connection)
+_SESSION = create_session(
+    pool_connections=1, pool_maxsize=1, retries=3,
+    status_forcelist=(429, 502, 503, 504)
+)
+
+# Market odds move on a scale of minutes
+EVENTS_CACHE_TTL = 300  # seconds
+
 # Target event slugs for Iran strike markets (avoiding near-term expiry)
 TARGET_EVENTS = [
     {
@@ -38,10 +50,12 @@ TARGET_EVENTS = [
 ]
 
 
+@memoize_ttl(EVENTS_CACHE_TTL)
 def fetch_events_by_slugs(slugs):
     """
     Fetch events by their slugs from Gamma API.
     Uses the slug query parameter which accepts an array.
+    Responses are cached for EVENTS_CACHE_TTL seconds.
 
     Docs: https://docs.polymarket.com/developers/gamma-markets-api/get-events
     """
@@ -51,32 +65,41 @@ def fetch_events_by_slugs(slugs):
     params = [('slug', s) for s in slugs]
     params.append(('closed', 'false'))
 
-    response = requests.get(url, params=params, timeout=30)
-    response.raise_for_status()
+    events = get_json(_SESSION, url, params=params)
+    parse_outcome_prices(events)
 
-    return response.json()
+    return events
+
+
+def parse_outcome_prices(events):
+    """
+    Decode each market's outcomePrices in place, once per fetch.
+    The API sends it as a JSON string: '["yes_price", "no_price"]'.
+    Unparseable values become None.
+    """
+    for event in events:
+        for market in event.get('markets') or []:
+            prices_raw = market.get('outcomePrices')
+            if isinstance(prices_raw, str):
+                try:
+                    market['outcomePrices'] = loads(prices_raw)
+                except ValueError:  # includes JSONDecodeError
+                    market['outcomePrices'] = None
 
 
 def get_market_price(market):
     """
     Extract YES price from market's outcomePrices.
-    outcomePrices is a JSON string: '["yes_price", "no_price"]'
+    Expects outcomePrices already decoded by parse_outcome_prices().
     """
-    prices_raw = market.get('outcomePrices')
+    prices = market.get('outcomePrices')
 
-    if not prices_raw:
+    if not prices:
         return None
 
     try:
-        # Parse JSON string to list
-        if isinstance(prices_raw, str):
-            prices = json.loads(prices_raw)
-        else:
-            prices = prices_raw
-
-        if prices and len(prices) >= 1:
-            return float(prices[0])
-    except (ValueError, TypeError, json.JSONDecodeError):
+        return float(prices[0])
+    except (ValueError, TypeError, IndexError, KeyError):
         pass
 
     return None
@@ -92,20 +115,23 @@ def find_best_market(event, preferred_dates):
     if not markets:
         return None
 
+    # Lowercase each question and parse each price once, up front
+    candidates = [
+        (market, (market.get('question') or '').lower())
+        for market in markets
+        if (get_market_price(market) or 0) > 0
+    ]
+
     # Try preferred dates in order
     for date_str in preferred_dates:
-        for market in markets:
-            question = market.get('question', '')
-            if date_str.lower() in question.lower():
-                price = get_market_price(market)
-                if price is not None and price > 0:
-                    return market
+        date_lower = date_str.lower()
+        for market, question_lower in candidates:
+            if date_lower in question_lower:
+                return market
 
     # Fallback: first market with valid price
-    for market in markets:
-        price = get_market_price(market)
-        if price is not None and price > 0:
-            return market
+    if candidates:
+        return candidates[0][0]
 
     return None
 
@@ -21,11 +21,20 @@ Uses anonymous access (no authentication required).
 CONFIDENCE: MEDIUM - callsign matching is unreliable, many military aircraft don't broadcast
 """
 
-import requests
+import re
 from datetime import datetime, timezone
 
+from _cache import memoize_ttl
+from _http import create_opensky_session, get_json
+
 BASE_URL = 'https://opensky-network.org/api/states/all'
 
+# Shared keep-alive session (same OpenSky configuration as aviation)
+_SESSION = create_opensky_session()
+
+# OpenSky anonymous data updates every ~10s; reuse responses briefly
+AIRCRAFT_CACHE_TTL = 60  # seconds
+
 # Wider Middle East bounding box
 # Covers: Eastern Mediterranean, Arabian Peninsula, Persian Gulf, Iraq, Iran
 MIDDLE_EAST_BBOX = {
@@ -55,6 +64,11 @@ TANKER_CALLSIGN_PREFIXES = [
     'BRASS',   # Tanker
 ]
 
+# All prefixes compiled into one anchored pattern (single C-level match)
+TANKER_CALLSIGN_RE = re.compile(
+    '(?:' + '|'.join(re.escape(p) for p in TANKER_CALLSIGN_PREFIXES) + ')'
+)
+
 # Minimum history for baseline calculation
 MIN_HISTORY_FOR_BASELINE = 6
 
@@ -62,8 +76,12 @@ MIN_HISTORY_FOR_BASELINE = 6
 SURGE_THRESHOLD = 12
 
 
+@memoize_ttl(AIRCRAFT_CACHE_TTL)
 def fetch_aircraft(bbox):
-    """Fetch aircraft states within a bounding box."""
+    """
+    Fetch aircraft states within a bounding box.
+    Responses are cached for AIRCRAFT_CACHE_TTL seconds per bbox.
+    """
     params = {
         'lamin': bbox['lamin'],
         'lamax': bbox['lamax'],
@@ -71,10 +89,7 @@ def fetch_aircraft(bbox):
         'lomax': bbox['lomax']
     }
 
-    response = requests.get(BASE_URL, params=params, timeout=30)
-    response.raise_for_status()
-
-    return response.json()
+    return get_json(_SESSION, BASE_URL, params=params)
 
 
 def is_tanker(callsign):
@@ -82,16 +97,20 @@ def is_tanker(callsign):
     if not callsign:
         return False
 
-    callsign_upper = callsign.upper().strip()
+    return TANKER_CALLSIGN_RE.match(callsign.upper().strip()) is not None
 
-    for prefix in TANKER_CALLSIGN_PREFIXES:
-        if callsign_upper.startswith(prefix):
-            return True
 
-    return False
+def get_baseline(history):
+    """
+    Rolling baseline (mean of history) computed once per run.
+    Returns None when there is not enough history yet.
+    """
+    if len(history) < MIN_HISTORY_FOR_BASELINE:
+        return None
+    return sum(history) / len(history)
 
 
-def calculate_risk_from_baseline(tanker_count, history):
+def calculate_risk_from_baseline(tanker_count, baseline):
     """
     Calculate risk based on deviation from rolling baseline.
 
@@ -105,6 +124,9 @@ def calculate_risk_from_baseline(tanker_count, history):
     - Normal (at/below baseline): 10-30 risk
     - Elevated (1.5x baseline): 40-60 risk
     - Surge (2x baseline or >12): 70-100 risk
+
+    Args:
+        baseline: Rolling average from get_baseline(), or None on cold start
     """
     # Absolute surge check first
     if tanker_count >= SURGE_THRESHOLD:
@@ -113,7 +135,7 @@ def calculate_risk_from_baseline(tanker_count, history):
     if tanker_count == 0:
         return 0
 
-    if len(history) < MIN_HISTORY_FOR_BASELINE:
+    if baseline is None:
         # Cold start: use simple scaling
         # 1-2 tankers = normal (20-30)
         # 3-5 tankers = elevated (40-60)
@@ -125,9 +147,6 @@ def calculate_risk_from_baseline(tanker_count, history):
         else:
             return min(100, 60 + (tanker_count - 5) * 10)
 
-    # Calculate rolling baseline
-    baseline = sum(history) / len(history)
-
     if baseline <= 0:
         baseline = 0.5  # Assume small baseline if no historical tankers
 
@@ -167,39 +186,39 @@ def get_tanker_risk(history=None):
 
     tankers = []
 
+    # OpenSky rows are fixed-width (17 fields):
+    # 0 = icao24, 1 = callsign, 2 = origin_country, 5 = longitude,
+    # 6 = latitude, 7 = baro_altitude, 8 = on_ground, 9 = velocity,
+    # 13 = geo_altitude
     for state in states:
-        if len(state) >= 17:
-            callsign = (state[1] or '').strip()
-            origin_country = state[2]
-            on_ground = state[8]
-
-            if on_ground:
-                continue
-
-            if is_tanker(callsign):
-                tankers.append({
-                    'icao24': state[0],
-                    'callsign': callsign,
-                    'origin_country': origin_country,
-                    'latitude': state[6],
-                    'longitude': state[5],
-                    'altitude': state[7] or state[13],
-                    'velocity': state[9]
-                })
+        # Discard ground traffic before touching any other field
+        if state[8]:
+            continue
+
+        callsign = (state[1] or '').strip()
+
+        if is_tanker(callsign):
+            tankers.append({
+                'icao24': state[0],
+                'callsign': callsign,
+                'origin_country': state[2],
+                'latitude': state[6],
+                'longitude': state[5],
+                'altitude': state[7] or state[13],
+                'velocity': state[9]
+            })
 
     tanker_count = len(tankers)
-    callsigns = [t['callsign'] for t in tankers]
 
-    # Calculate risk from rolling baseline
-    risk = calculate_risk_from_baseline(tanker_count, history)
+    # Calculate risk from rolling baseline (single pass over history)
+    baseline_avg = get_baseline(history)
+    risk = calculate_risk_from_baseline(tanker_count, baseline_avg)
 
     # Determine status
-    if len(history) >= MIN_HISTORY_FOR_BASELINE:
-        baseline_avg = sum(history) / len(history)
+    if baseline_avg is not None:
         ratio = tanker_count / baseline_avg if baseline_avg > 0 else 0
         is_surge = tanker_count >= SURGE_THRESHOLD or ratio >= 2.0
     else:
-        baseline_avg = None
         ratio = None
         is_surge = tanker_count >= SURGE_THRESHOLD
 
@@ -210,7 +229,7 @@ def get_tanker_risk(history=None):
         'detail': f'{tanker_count} detected ({status})',
         'raw_data': {
             'tanker_count': tanker_count,
-            'callsigns': callsigns,
+            'callsigns': [t['callsign'] for t in tankers],
             'baseline_avg': round(baseline_avg, 1) if baseline_avg else None,
             'ratio_to_baseline': round(ratio, 2) if ratio else None,
             'is_surge': is_surge,
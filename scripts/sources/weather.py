@@ -21,11 +21,20 @@ import urllib3.util.connection
 # Force IPv4 to avoid GitHub Actions IPv6 issues
 urllib3.util.connection.HAS_IPV6 = False
 
-import requests
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+from _cache import memoize_ttl
+from _http import create_session, get_json
+
 BASE_URL = 'https://api.open-meteo.com/v1/forecast'
 
+# Open-Meteo current conditions refresh roughly every 15 minutes. Kept
+# below the 10-minute update interval so a tick never reuses the
+# previous tick's response
+WEATHER_CACHE_TTL = 540  # seconds
+
 # Key locations in Iran to monitor
 IRAN_LOCATIONS = [
     {'name': 'Tehran', 'lat': 35.6892, 'lon': 51.3890},
@@ -34,6 +43,9 @@ IRAN_LOCATIONS = [
     {'name': 'Bushehr', 'lat': 28.9234, 'lon': 50.8203},  # Nuclear plant
 ]
 
+# Shared keep-alive session (one pooled connection per concurrent location fetch)
+_SESSION = create_session(pool_connections=1, pool_maxsize=len(IRAN_LOCATIONS))
+
 # WMO Weather codes (https://open-meteo.com/en/docs)
 # 0: Clear sky
 # 1-3: Mainly clear, partly cloudy, overcast
@@ -44,11 +56,59 @@ IRAN_LOCATIONS = [
 # 80-82: Rain showers
 # 95-99: Thunderstorm
 
-
+# Scoring tables (FM 34-81-1), looked up with bisect instead of if/elif
+# Visibility (m): <3km=0, 3-5km=5, 5-10km=10, 10-20km=25, >=20km=30
+VISIBILITY_THRESHOLDS = [3000, 5000, 10000, 20000]
+VISIBILITY_SCORES = [0, 5, 10, 25, 30]
+
+# Cloud cover (%): <=20=30, <=40=20, <=60=10, <=80=5, overcast=0
+CLOUD_THRESHOLDS = [20, 40, 60, 80]
+CLOUD_SCORES = [30, 20, 10, 5, 0]
+
+# Wind (km/h): <=30=10, <=50=7, <=65=3 (35 knot limit), above=0
+WIND_THRESHOLDS = [30, 50, 65]
+WIND_SCORES = [10, 7, 3, 0]
+
+# Weather code: clear=30, mainly clear/partly cloudy=25, overcast=10,
+# fog=5, any precipitation/storm=0
+WEATHER_CODE_SCORES = {0: 30, 1: 25, 2: 25, 3: 10, 45: 5, 48: 5}
+
+# Condition labels by score: >=80 clear, >=60 favorable, >=40 marginal
+CONDITION_THRESHOLDS = [40, 60, 80]
+CONDITION_LABELS = ['poor', 'marginal', 'favorable', 'clear']
+
+# Human-readable WMO weather code descriptions
+WEATHER_DESCRIPTIONS = {
+    0: 'clear sky',
+    1: 'mainly clear',
+    2: 'partly cloudy',
+    3: 'overcast',
+    45: 'fog',
+    48: 'depositing rime fog',
+    51: 'light drizzle',
+    53: 'moderate drizzle',
+    55: 'dense drizzle',
+    61: 'slight rain',
+    63: 'moderate rain',
+    65: 'heavy rain',
+    71: 'slight snow',
+    73: 'moderate snow',
+    75: 'heavy snow',
+    80: 'slight rain showers',
+    81: 'moderate rain showers',
+    82: 'violent rain showers',
+    95: 'thunderstorm',
+    96: 'thunderstorm with slight hail',
+    99: 'thunderstorm with heavy hail',
+}
+
+
+@memoize_ttl(WEATHER_CACHE_TTL)
 def fetch_weather(lat, lon):
     """
     Fetch current weather for a location using Open-Meteo.
     No API key required.
+    Responses are cached for WEATHER_CACHE_TTL seconds per location.
     """
     params = {
         'latitude': lat,
@@ -56,10 +116,7 @@ def fetch_weather(lat, lon):
         'current': 'temperature_2m,weather_code,cloud_cover,visibility,wind_speed_10m'
     }
 
-    response = requests.get(BASE_URL, params=params, timeout=30)
-    response.raise_for_status()
-
-    return response.json()
+    return get_json(_SESSION, BASE_URL, params=params)
 
 
 def calculate_weather_score(weather_data):
@@ -74,53 +131,22 @@ def calculate_weather_score(weather_data):
     - Weather: Precipitation/storms ground operations
     """
     current = weather_data.get('current', {})
-    score = 0
 
-    # Visibility (in meters) - FM 34-81-1: >10km optimal
+    # Visibility (in meters) - FM 34-81-1: >10km optimal (lower bounds inclusive)
     visibility = current.get('visibility', 10000)
-    if visibility >= 20000:
-        score += 30  # Excellent (>20km)
-    elif visibility >= 10000:
-        score += 25  # Good - meets FM 34-81-1 minimum
-    elif visibility >= 5000:
-        score += 10  # Marginal (5-10km)
-    elif visibility >= 3000:
-        score += 5   # Poor (3-5km)
-    # else: <3km = degraded operations, no points
+    score = VISIBILITY_SCORES[bisect_right(VISIBILITY_THRESHOLDS, visibility)]
 
     # Cloud cover (percentage) - clear skies needed for precision munitions
     clouds = current.get('cloud_cover', 0)
-    if clouds <= 20:
-        score += 30  # Clear - optimal for PGMs
-    elif clouds <= 40:
-        score += 20  # Mostly clear
-    elif clouds <= 60:
-        score += 10  # Partly cloudy - some degradation
-    elif clouds <= 80:
-        score += 5   # Mostly cloudy - significant degradation
-    # else: Overcast - no precision capability, no points
+    score += CLOUD_SCORES[bisect_left(CLOUD_THRESHOLDS, clouds)]
 
     # Weather code - precipitation/storms cancel operations
     weather_code = current.get('weather_code', 0)
-    if weather_code == 0:
-        score += 30  # Clear sky - optimal
-    elif weather_code <= 2:
-        score += 25  # Mainly clear to partly cloudy
-    elif weather_code == 3:
-        score += 10  # Overcast but dry
-    elif weather_code in [45, 48]:
-        score += 5   # Fog - limited visibility
-    # Rain (51-65), Snow (71-77), Thunderstorm (95-99) = 0 points
+    score += WEATHER_CODE_SCORES.get(weather_code, 0)
 
     # Wind (km/h) - FM 34-81-1: <35 knots (65 km/h) operational limit
     wind_speed = current.get('wind_speed_10m', 0)
-    if wind_speed <= 30:
-        score += 10  # Calm to light (<16 knots)
-    elif wind_speed <= 50:
-        score += 7   # Moderate (16-27 knots)
-    elif wind_speed <= 65:
-        score += 3   # Near limit (27-35 knots)
-    # >65 km/h (35 knots) = operations limited, no points
+    score += WIND_SCORES[bisect_left(WIND_THRESHOLDS, wind_speed)]
 
     return min(100, score)
 
@@ -129,44 +155,14 @@ def get_weather_description(weather_code):
     """
     Get human-readable description from WMO weather code.
     """
-    descriptions = {
-        0: 'clear sky',
-        1: 'mainly clear',
-        2: 'partly cloudy',
-        3: 'overcast',
-        45: 'fog',
-        48: 'depositing rime fog',
-        51: 'light drizzle',
-        53: 'moderate drizzle',
-        55: 'dense drizzle',
-        61: 'slight rain',
-        63: 'moderate rain',
-        65: 'heavy rain',
-        71: 'slight snow',
-        73: 'moderate snow',
-        75: 'heavy snow',
-        80: 'slight rain showers',
-        81: 'moderate rain showers',
-        82: 'violent rain showers',
-        95: 'thunderstorm',
-        96: 'thunderstorm with slight hail',
-        99: 'thunderstorm with heavy hail',
-    }
-    return descriptions.get(weather_code, 'unknown')
+    return WEATHER_DESCRIPTIONS.get(weather_code, 'unknown')
 
 
 def get_condition_label(score):
     """
     Get human-readable condition label.
     """
-    if score >= 80:
-        return 'clear'
-    elif score >= 60:
-        return 'favorable'
-    elif score >= 40:
-        return 'marginal'
-    else:
-        return 'poor'
+    return CONDITION_LABELS[bisect_right(CONDITION_THRESHOLDS, score)]
 
 
 def get_weather_risk():
@@ -177,8 +173,13 @@ def get_weather_risk():
     location_scores = []
     location_data = []
 
-    for loc in IRAN_LOCATIONS:
-        weather = fetch_weather(loc['lat'], loc['lon'])
+    # Fetch all locations concurrently (results keep IRAN_LOCATIONS order)
+    with ThreadPoolExecutor(max_workers=len(IRAN_LOCATIONS)) as executor:
+        forecasts = list(executor.map(
+            lambda loc: fetch_weather(loc['lat'], loc['lon']), IRAN_LOCATIONS
+        ))
+
+    for loc, weather in zip(IRAN_LOCATIONS, forecasts):
         current = weather.get('current', {})
 
         score = calculate_weather_score(weather)
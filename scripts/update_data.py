@@ -6,15 +6,18 @@ Fetches data from all sources, calculates total risk, and writes to data.json.
 NO FALLBACK DATA - if any API fails, this script will exit with an error.
 """
 
-import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 # Add sources directory to path
 sys.path.insert(0, str(Path(__file__).parent / 'sources'))
 
+from sources._cache import prune_disk
+from sources._fastjson import dumps, loads
 from sources.news import get_news_risk
 from sources.aviation import get_aviation_risk
 from sources.tankers import get_tanker_risk
@@ -55,9 +58,8 @@ def load_existing_data():
     """
     if OUTPUT_FILE.exists():
         try:
-            with open(OUTPUT_FILE, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            return loads(OUTPUT_FILE.read_bytes())
+        except (ValueError, OSError):
             pass
     return None
 
@@ -66,38 +68,38 @@ def update_history(existing_history, new_value, max_length=HISTORY_LENGTH):
     """
     Add new value to history array, maintaining max length.
     """
-    if existing_history is None:
-        existing_history = []
-
-    history = list(existing_history)
+    history = list(existing_history or ())
     history.append(new_value)
 
-    # Trim to max length (keep most recent)
+    # Trim to max length in place (keep most recent)
     if len(history) > max_length:
-        history = history[-max_length:]
+        del history[:-max_length]
 
     return history
 
 
-def update_trend_history(existing_history, new_risk, timestamp_ms):
+def update_trend_history(existing_history, new_risk, timestamp_ms, last_pinned_ts=None):
     """
     Update the 72-hour trend history.
     Pins hourly entries for the chart.
+
+    last_pinned_ts is the timestamp of the most recent pinned entry, stored
+    next to the history; files written before it existed fall back to a
+    reverse scan. Returns (history, last_pinned_ts).
     """
     if existing_history is None:
         existing_history = []
 
     history = list(existing_history)
 
-    # Check if we should pin this entry (once per hour)
-    should_pin = True
-    if history:
+    if last_pinned_ts is None and history:
         last_pinned = next((h for h in reversed(history) if h.get('pinned')), None)
         if last_pinned:
-            last_timestamp = last_pinned.get('timestamp', 0)
-            # Pin if more than 50 minutes since last pin
-            if timestamp_ms - last_timestamp < 50 * 60 * 1000:
-                should_pin = False
+            last_pinned_ts = last_pinned.get('timestamp', 0)
+
+    # Check if we should pin this entry (once per hour)
+    # Pin if more than 50 minutes since last pin
+    should_pin = last_pinned_ts is None or timestamp_ms - last_pinned_ts >= 50 * 60 * 1000
 
     # Add new entry
     entry = {
@@ -106,6 +108,7 @@ def update_trend_history(existing_history, new_risk, timestamp_ms):
     }
     if should_pin:
         entry['pinned'] = True
+        last_pinned_ts = timestamp_ms
 
     history.append(entry)
 
@@ -114,43 +117,104 @@ def update_trend_history(existing_history, new_risk, timestamp_ms):
     max_entries = 80
 
     if len(history) > max_entries:
-        # Keep all pinned entries from last 72 hours and recent entries
+        # Keep all pinned entries from last 72 hours and the 10 most recent
+        # entries, in one pass that preserves time order
         cutoff_ms = timestamp_ms - (72 * 60 * 60 * 1000)
-        filtered = [h for h in history if h.get('pinned') and h.get('timestamp', 0) > cutoff_ms]
-        # Add most recent entries if not enough
-        recent = [h for h in history[-10:] if h not in filtered]
-        history = filtered + recent
+        recent_start = len(history) - 10
+        history = [
+            h for i, h in enumerate(history)
+            if i >= recent_start or (h.get('pinned') and h.get('timestamp', 0) > cutoff_ms)
+        ]
 
-    return history
+    return history, last_pinned_ts
 
 
-def calculate_total_risk(signals):
+def aggregate_signals(signals, existing=None, threshold=50):
     """
-    Calculate weighted total risk from all signals.
+    Single pass over all weighted signals: attach each signal's display
+    history (for sparkline charts) and accumulate the weighted total risk
+    and the count of signals at or above the elevated threshold.
+    Missing signals are left out and the remaining weights renormalized.
+
+    Returns (total_risk, elevated_count).
     """
+    existing = existing or {}
     total = 0
     weight_sum = 0
+    elevated_count = 0
 
     for key, weight in WEIGHTS.items():
-        if key in signals and 'risk' in signals[key]:
-            total += signals[key]['risk'] * weight
-            weight_sum += weight
+        signal = signals.get(key)
+        if not signal or 'risk' not in signal:
+            continue
+
+        existing_history = existing.get(key, {}).get('history')
+        signal['history'] = update_history(existing_history, signal['risk'])
+
+        total += signal['risk'] * weight
+        weight_sum += weight
+        if signal['risk'] >= threshold:
+            elevated_count += 1
+
+    total_risk = int(total / weight_sum) if weight_sum > 0 else 0
 
-    if weight_sum > 0:
-        return int(total / weight_sum * (sum(WEIGHTS.values()) / weight_sum))
+    return total_risk, elevated_count
 
-    return 0
+
+def fetch_signals(aviation_baseline, tanker_baseline):
+    """
+    Fetch all signals concurrently - every source is independent and
+    I/O-bound, so wall time is the slowest source rather than the sum.
+    NO TRY/EXCEPT - future.result() re-raises any source's error.
+    """
+    fetchers = {
+        'news': ('News', get_news_risk, {}),
+        'aviation': ('Aviation', get_aviation_risk, {'history': aviation_baseline}),
+        'tanker': ('Tanker', get_tanker_risk, {'history': tanker_baseline}),
+        'pentagon': ('Pentagon', get_pentagon_pizza_risk, {}),
+        'polymarket': ('Polymarket', get_polymarket_risk, {}),
+        'weather': ('Weather', get_weather_risk, {}),
+    }
+
+    print('Fetching all signals...')
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        futures = {
+            key: executor.submit(fetch, **kwargs)
+            for key, (_, fetch, kwargs) in fetchers.items()
+        }
+
+        signals = {}
+        for key, future in futures.items():
+            signals[key] = future.result()
+            print(f'  {fetchers[key][0]} risk: {signals[key]["risk"]}')
+
+    return signals
 
 
-def count_elevated_signals(signals, threshold=50):
+def write_output(output):
     """
-    Count how many signals are above the elevated threshold.
+    Stream compact JSON to data.json one top-level value at a time, so only
+    one signal's serialized bytes are held in memory at once. Writes to a
+    temp file and swaps it in so readers never see a partial file; on
+    failure the temp file is removed and the error re-raised.
     """
-    count = 0
-    for key in WEIGHTS.keys():
-        if key in signals and signals[key].get('risk', 0) >= threshold:
-            count += 1
-    return count
+    tmp_file = OUTPUT_FILE.with_suffix('.json.tmp')
+
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(b'{')
+            for i, (key, value) in enumerate(output.items()):
+                if i:
+                    f.write(b',')
+                f.write(dumps(key))
+                f.write(b':')
+                f.write(dumps(value))
+            f.write(b'}')
+
+        os.replace(tmp_file, OUTPUT_FILE)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
 
 
 def main():
@@ -159,14 +223,12 @@ def main():
     """
     print('Starting data update...')
 
+    # Drop expired response cache entries so .cache/ stays bounded
+    prune_disk()
+
     # Load existing data for history
     existing = load_existing_data()
 
-    # Fetch all signals - NO TRY/EXCEPT, let errors propagate
-    print('Fetching news data...')
-    news = get_news_risk()
-    print(f'  News risk: {news["risk"]}')
-
     # Get rolling baseline histories for aviation and tankers
     aviation_baseline = []
     tanker_baseline = []
@@ -174,42 +236,10 @@ def main():
         aviation_baseline = existing.get('aviation', {}).get('raw_data', {}).get('baseline_history', [])
         tanker_baseline = existing.get('tanker', {}).get('raw_data', {}).get('baseline_history', [])
 
-    print('Fetching aviation data...')
-    aviation = get_aviation_risk(history=aviation_baseline)
-    print(f'  Aviation risk: {aviation["risk"]}')
-
-    print('Fetching tanker data...')
-    tanker = get_tanker_risk(history=tanker_baseline)
-    print(f'  Tanker risk: {tanker["risk"]}')
-
-    print('Fetching Pentagon pizza data...')
-    pentagon = get_pentagon_pizza_risk()
-    print(f'  Pentagon risk: {pentagon["risk"]}')
-
-    print('Fetching Polymarket data...')
-    polymarket = get_polymarket_risk()
-    print(f'  Polymarket risk: {polymarket["risk"]}')
-
-    print('Fetching weather data...')
-    weather = get_weather_risk()
-    print(f'  Weather risk: {weather["risk"]}')
-
-    # Build signals dict
-    signals = {
-        'news': news,
-        'aviation': aviation,
-        'tanker': tanker,
-        'pentagon': pentagon,
-        'polymarket': polymarket,
-        'weather': weather,
-    }
-
-    # Update display histories (for sparkline charts)
-    for key in signals:
-        existing_history = None
-        if existing and key in existing:
-            existing_history = existing[key].get('history')
-        signals[key]['history'] = update_history(existing_history, signals[key]['risk'])
+    # Fetch all signals - errors propagate
+    signals = fetch_signals(aviation_baseline, tanker_baseline)
+    aviation = signals['aviation']
+    tanker = signals['tanker']
 
     # Update rolling baseline histories for aviation and tankers
     # Aviation: store total_count for 24-hour baseline
@@ -222,20 +252,23 @@ def main():
     new_tanker_baseline = update_history(tanker_baseline, tanker_count, TANKER_HISTORY_LENGTH)
     tanker['raw_data']['baseline_history'] = new_tanker_baseline
 
-    # Calculate total risk
-    total_risk = calculate_total_risk(signals)
-    elevated_count = count_elevated_signals(signals)
+    # Update display histories and calculate total risk in one pass
+    total_risk, elevated_count = aggregate_signals(signals, existing)
 
     print(f'Total risk: {total_risk}')
     print(f'Elevated signals: {elevated_count}')
 
     # Update trend history
-    timestamp_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+    timestamp_ms = time.time_ns() // 1_000_000
     existing_trend = None
+    last_pinned_ts = None
     if existing and 'total_risk' in existing:
         existing_trend = existing['total_risk'].get('history')
+        last_pinned_ts = existing['total_risk'].get('last_pinned_ts')
 
-    trend_history = update_trend_history(existing_trend, total_risk, timestamp_ms)
+    trend_history, last_pinned_ts = update_trend_history(
+        existing_trend, total_risk, timestamp_ms, last_pinned_ts
+    )
 
     # Build final output
     output = {
@@ -244,13 +277,12 @@ def main():
             'risk': total_risk,
             'history': trend_history,
             'elevated_count': elevated_count,
+            'last_pinned_ts': last_pinned_ts,
         },
         'last_updated': datetime.now(timezone.utc).isoformat(),
     }
 
-    # Write to file
-    with open(OUTPUT_FILE, 'w') as f:
-        json.dump(output, f, indent=2)
+    write_output(output)
 
     print(f'Data written to {OUTPUT_FILE}')
     print('Update complete.')